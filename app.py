@@ -1,7 +1,11 @@
 import json
+import os
 import base64
 import streamlit as st
+from html import escape
+from io import BytesIO
 from pathlib import Path
+from PIL import Image
 
 try:
     import fitz
@@ -9,6 +13,12 @@ try:
 except Exception:
     HAVE_PYMUPDF = False
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 st.set_page_config(
     page_title="Portfolio Showcase: Projects I'm Proud Of",
     page_icon="📁",
@@ -18,73 +28,150 @@ st.set_page_config(
 ASSETS = Path("assets")
 RESUME_PATH = ASSETS / "Ta-asan Ralph Vincent - Résumé.pdf"
 SIGNATURE_PATH = ASSETS / "signature1.png"
+REFLECTIONS_PATH = ASSETS / "reflections.html"
+
+def _asset_names() -> frozenset:
+    try:
+        return frozenset(entry.name for entry in os.scandir(ASSETS))
+    except OSError:
+        return frozenset()
+
+ASSET_NAMES = _asset_names()
+
+def _file_key(path: Path) -> tuple[float, int]:
+    try:
+        stat = path.stat()
+        return stat.st_mtime, stat.st_size
+    except OSError:
+        return 0.0, 0
 
 @st.cache_data
-def load_json_list(path: Path, mtime: float):
+def load_json_list(path: Path, mtime: float, size: int):
     if not path.exists():
         return []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
         return data if isinstance(data, list) else []
     except json.JSONDecodeError as e:
         st.error(f"Invalid JSON in {path.name}: {e}")
         return []
 
+@st.cache_data
+def _load_pdf_bytes(path: str, mtime: float, size: int) -> bytes:
+    return Path(path).read_bytes()
+
+def _iter_pdf_pages(pdf_bytes: bytes, zoom: float):
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        for i in range(doc.page_count):
+            pix = doc.load_page(i).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            yield pix.pil_tobytes(format="JPEG", optimize=True, quality=82)
+            del pix
+    finally:
+        doc.close()
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _render_pdf_pages(pdf_bytes: bytes, zoom: float) -> list[bytes]:
+    return list(_iter_pdf_pages(pdf_bytes, zoom))
+
+@st.cache_data(max_entries=2)
+def _pdf_b64(pdf_bytes: bytes) -> str:
+    return base64.b64encode(pdf_bytes).decode("utf-8")
+
+@st.cache_data
+def _thumb(path: str, mtime: float, w: int = 600) -> bytes:
+    img = Image.open(path)
+    img.thumbnail((w, w * 2))
+    buf = BytesIO()
+    img.convert("RGB").save(buf, format="JPEG", quality=82)
+    return buf.getvalue()
+
+@st.cache_data
+def _reflections_html(mtime: float, size: int) -> str:
+    return REFLECTIONS_PATH.read_text(encoding="utf-8")
+
+@st.cache_data
+def load_projects(path: Path, mtime: float, size: int):
+    data = load_json_list(path, mtime, size)
+    for p in data:
+        p["_search_text"] = (p.get("title", "") + " " + p.get("blurb", "")).lower()
+        p["_tagset"] = frozenset(p.get("tags", []))
+    all_tags = sorted({t for p in data for t in p.get("tags", [])})
+    return data, all_tags
+
 proj_path = Path("projects.json")
 xp_path = Path("experiences.json")
 
-projects = load_json_list(proj_path, proj_path.stat().st_mtime if proj_path.exists() else 0)
-experiences = load_json_list(xp_path, xp_path.stat().st_mtime if xp_path.exists() else 0)
+projects, all_tags = load_projects(proj_path, *_file_key(proj_path))
+experiences = load_json_list(xp_path, *_file_key(xp_path))
 
 st.sidebar.title("Explore Projects")
 if st.sidebar.button("↻ Refresh data"):
     st.cache_data.clear()
     st.rerun()
 
-st.session_state["wide"] = st.sidebar.toggle(
+wide = st.sidebar.toggle(
     "Two-column layout",
     value=True,
+    key="wide",
     help="Turn off for a single-column (mobile) list."
 )
 
-all_tags = sorted({t for p in (projects or []) for t in p.get("tags", [])})
-query = st.sidebar.text_input("Search title")
+with st.sidebar.form("search", border=False):
+    query = st.text_input("Search title")
+    st.form_submit_button("Search", use_container_width=True)
 selected = st.sidebar.multiselect("Filter by tags", options=all_tags)
 
-def render_card(p):
-    col_img, col_txt = st.columns([1, 2], gap="medium")
-    with col_img:
-        img_path = ASSETS / p["image"]
-        if img_path.exists():
-            st.image(str(img_path), use_container_width=True, clamp=True)
-        else:
-            st.markdown(f"🖼️ *Missing image:* `{p['image']}`")
-            st.caption("Place it under `assets/` with this exact filename.")
-    with col_txt:
-        st.subheader(p["title"])
-        if p.get("tags"):
-            st.caption(", ".join(p["tags"]))
-        st.write(p.get("blurb", ""))
-        links = p.get("links", {})
-        if links:
-            n = min(4, len(links))
-            link_cols = st.columns(n, gap="small")
-            for (label, url), c in zip(links.items(), link_cols):
-                with c:
-                    st.link_button(label, url)
-
-def matches(p):
-    if selected and not set(selected).intersection(set(p.get("tags", []))):
-        return False
-    if query:
-        q = query.lower()
-        text = (p["title"] + " " + p.get("blurb", "")).lower()
-        if q not in text:
-            return False
-    return True
+_CARD_CSS = """
+<style>
+.pf-grid { display: grid; grid-template-columns: minmax(0, 1fr); gap: 2rem; }
+.pf-grid.two { grid-template-columns: repeat(2, minmax(0, 1fr)); }
+.pf-card { display: flex; gap: 1rem; align-items: flex-start; }
+.pf-card img { width: 33%; border-radius: 8px; object-fit: contain; }
+.pf-card .pf-missing { width: 33%; color: gray; font-size: 0.9rem; }
+.pf-card .pf-body { flex: 1; min-width: 0; }
+.pf-card h3 { margin: 0 0 0.25rem 0; }
+.pf-card .pf-tags { color: gray; font-size: 0.85rem; margin: 0 0 0.5rem 0; }
+.pf-card .pf-links { margin-top: 0.5rem; }
+.pf-card .pf-links a { display: inline-block; margin-right: 0.5rem; padding: 0.25rem 0.75rem;
+    border: 1px solid rgba(128,128,128,0.4); border-radius: 8px; text-decoration: none; }
+</style>
+"""
 
-def render_showcase():
-    filtered = [p for p in (projects or []) if matches(p)]
+@st.cache_data
+def _card_html(p: dict, img_mtime: float) -> str:
+    title = escape(p.get("title", ""))
+    if img_mtime:
+        img_path = ASSETS / p["image"]
+        b64 = base64.b64encode(_thumb(str(img_path), img_mtime)).decode("ascii")
+        img_html = f"<img src='data:image/jpeg;base64,{b64}' alt='{title}'>"
+    else:
+        img_html = (
+            f"<div class='pf-missing'>🖼️ Missing image: <code>{escape(p['image'])}</code><br>"
+            "Place it under <code>assets/</code> with this exact filename.</div>"
+        )
+    parts = [img_html, "<div class='pf-body'>", f"<h3>{title}</h3>"]
+    if p.get("tags"):
+        parts.append(f"<p class='pf-tags'>{escape(', '.join(p['tags']))}</p>")
+    parts.append(f"<p>{escape(p.get('blurb', ''))}</p>")
+    links = list(p.get("links", {}).items())[:4]
+    if links:
+        parts.append(
+            "<div class='pf-links'>"
+            + "".join(f"<a href='{escape(url)}' target='_blank'>{escape(label)}</a>" for label, url in links)
+            + "</div>"
+        )
+    parts.append("</div>")
+    return "<div class='pf-card'>" + "".join(parts) + "</div>"
+
+def render_showcase(wide):
+    q = query.lower() if query else None
+    sel_set = frozenset(selected)
+    filtered = [
+        p for p in (projects or [])
+        if (not sel_set or sel_set & p["_tagset"]) and (not q or q in p["_search_text"])
+    ]
     st.title("Portfolio Showcase: Projects I'm Proud Of")
     st.markdown(
         "Hi, I'm Ralph Vincent Ta-asan — a data storyteller, strategist, and an explorer. "
@@ -92,17 +179,17 @@ def render_showcase():
         "Use the filters on the left to explore how I think, build, and tell stories through data."
     )
     st.write(f"Showing **{len(filtered)}** of **{len(projects or [])}** projects.")
-    if st.session_state.get("wide", True):
-        cols = st.columns(2, gap="large")
-        for i, p in enumerate(filtered):
-            with cols[i % 2]:
-                render_card(p)
-                st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
-    else:
-        for p in filtered:
-            render_card(p)
-            st.markdown("<div style='height: 1rem'></div>", unsafe_allow_html=True)
+    cards = []
+    for p in filtered:
+        img_mtime = (ASSETS / p["image"]).stat().st_mtime if p["image"] in ASSET_NAMES else 0.0
+        cards.append(_card_html(p, img_mtime))
+    grid_class = "pf-grid two" if wide else "pf-grid"
+    st.markdown(
+        _CARD_CSS + f"<div class='{grid_class}'>" + "".join(cards) + "</div>",
+        unsafe_allow_html=True,
+    )
 
+@st.fragment
 def render_resume():
     st.title("Electronic Résumé")
     st.caption("View inline, print directly, or download the PDF version.")
@@ -110,7 +197,7 @@ def render_resume():
         st.error(f"Résumé file not found at: {RESUME_PATH}")
         st.info("Place your PDF in the assets/ folder with that exact filename.")
         return
-    pdf_bytes = RESUME_PATH.read_bytes()
+    pdf_bytes = _load_pdf_bytes(str(RESUME_PATH), *_file_key(RESUME_PATH))
     st.download_button(
         label="Download Résumé (PDF)",
         data=pdf_bytes,
@@ -134,14 +221,13 @@ def render_resume():
                 min_value=600, max_value=1200, value=900, step=50,
                 help="Adjust how wide the rendered pages appear."
             )
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            for page in doc:
-                pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
-                left, mid, right = st.columns([1, 4, 1])
-                with mid:
-                    st.image(pix.tobytes("png"), width=display_px)
+            with st.spinner("Rendering résumé pages…"):
+                pages = _render_pdf_pages(pdf_bytes, 1.5)
+            left, mid, right = st.columns([1, 4, 1])
+            with mid:
+                st.image(pages, width=display_px)
             return
-    b64 = base64.b64encode(pdf_bytes).decode("utf-8")
+    b64 = _pdf_b64(pdf_bytes)
     st.markdown(
         f"""
         <iframe
@@ -152,6 +238,7 @@ def render_resume():
         unsafe_allow_html=True,
     )
 
+@st.fragment
 def render_experiential():
     st.title("Experiential Learning")
     st.caption("Volunteer work, student organization involvement, apprenticeships, field trips, special projects and employment. Upload and describe photos, job descriptions and completed projects.")
@@ -161,9 +248,8 @@ def render_experiential():
     mode = st.radio("Layout", ["Feature", "Cards"], horizontal=True, label_visibility="collapsed")
     if mode == "Feature":
         for exp in experiences:
-            img_path = ASSETS / exp.get("image", "")
-            if img_path.exists():
-                st.image(str(img_path), use_container_width=True)
+            if exp.get("image", "") in ASSET_NAMES:
+                st.image(str(ASSETS / exp["image"]), use_container_width=True)
             st.markdown(f"## {exp.get('title','')}")
             meta = " - ".join(filter(None, [exp.get("date", ""), ", ".join(exp.get("tags", []))]))
             if meta:
@@ -182,9 +268,8 @@ def render_experiential():
         cols = st.columns(2, gap="large")
         for i, exp in enumerate(experiences):
             with cols[i % 2]:
-                img_path = ASSETS / exp.get("image", "")
-                if img_path.exists():
-                    st.image(str(img_path), use_container_width=True)
+                if exp.get("image", "") in ASSET_NAMES:
+                    st.image(str(ASSETS / exp["image"]), use_container_width=True)
                 st.subheader(exp.get("title",""))
                 if exp.get("date"):
                     st.caption(exp["date"])
@@ -195,55 +280,13 @@ def render_experiential():
                         st.markdown(exp["body_md"])
                 st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
 
+@st.fragment
 def render_reflections():
     st.title("*I've always loved numbers. But never quite like this.*")
-    reflections_md = """
-I still remember the exact moment I felt something shift. It wasn’t a grand event, a medal, a recognition, or even a final exam. It was in a quiet lecture hall, the kind where most students tune out after the first hour. I had just run my very first regression. What struck me wasn’t the math; it was how the data spoke. It whispered back a pattern, a direction, a meaning. In that moment I realized that learning wasn’t just about numbers or performance; it was about listening. In many ways that small whisper from the data became the loudest voice in my entire college journey.
-
-I didn’t begin my college years with this clarity. Like many students, I entered school with the mindset of accumulation. I thought the goal was to collect lectures, handouts, readings, and definitions. I over-consumed knowledge as if success were a matter of quantity. It felt like moving into a tiny condo and buying every piece of furniture I saw online. I filled my mental space with everything, hoping that if I just stored enough, I would become the kind of student who “had it all.” Instead I ended up cluttered, confused, and overwhelmed. I was burnt out, and my grades reflected it. It wasn’t until I slowed down that I understood real learning isn’t about remembering everything; it’s about curating what truly matters. That was the beginning of my “capsule life” philosophy. If I had to pack all my learnings into a small capsule to carry into the future, what would I choose to keep? What beliefs, skills, and mindsets are truly worth carrying forward? This shift, from hoarding knowledge to keeping only what’s essential, quietly transformed how I approached life, work, and learning.
-
-The lesson deepened during a morning walk when I realized something else. I want to grow in many aspects of life, yet I cannot grow in all of them simultaneously without compromise. I thought about random dreams: learning to crochet, completing the Google Data Analytics course, building a game in Unreal Engine, writing a book, making music. All are exciting, but to get good at something and see real results, I must commit for a long time. Trying to do everything would leave me a master of none. Just as I can name the shoes I no longer wear and the gadgets I no longer use, I can name the skills and dreams that truly matter to me now. To under-consume, I had to over-consume first. I had to try things to make sure they weren’t for me. From that I learned the same is true for knowledge: to surround myself with what matters, I must choose with intention.
-
-Another pivotal turning point came when I realized I had been working for grades, not for growth. It’s easy to fall into that trap where everything centers on output: final scores, rubrics, checklists. Yet grades are the wrong kind of fuel; they burn fast and leave you empty. Only when I started doing projects for joy, curiosity, and the simple excitement of solving something meaningful did things begin to change. I remember stumbling upon a Taylor Swift lyric, “to live for the hope of it all”. That line stuck not as romance but as a question: what does it mean to hope? Can hope be measured? Could there be a formula for staying, trying, and believing in the possibility of something good?
-
-It might seem unusual to begin a reflection on how numbers changed my life with a pop lyric. She wasn’t talking mathematics, yet her words felt like a personal challenge. Will hope ever come? Is there truly hope in it all? Can a formula prove it, a way to measure the chance of something happening at least once?
-
-Statistics has an answer.
-
-Life often feels like a race. You may not be the fastest, the strongest, or anywhere near the front, but what if you simply stayed? What if you kept showing up long after others stopped? You might remain the slowest, yet when you’re the only one left, you find yourself in first place.
-
-Life isn’t a single probability; it’s a collection layered over time. Some events are beyond control, while others tilt in our favor simply by showing up. The probability of something happening at least once after n attempts is 1 − (1 − p)ⁿ, where p is success on one try, 1 − p is failure on one try, and n is the number of attempts.
-
-Try once and your chance is merely p. Try twice and the failure chance multiplies by itself, shrinking to 25 percent if 1 - p equals 50 percent. Three tries reduce it further. Ten tries, a hundred tries; eventually the chance of it not happening becomes so small that life has no choice but to let it happen.
-
-This formula says that if you try enough times, success arrives at least once. Beyond mathematics lies presence. How can you live for the hope of it all if you remove every chance by never showing up? Be the person who stays; be the person who tries again. Turn up for the 0.0001 percent chance, because if not today, perhaps tomorrow. In an uncertain world, statistics remain certain, and when you keep showing up, the math eventually whispers, “Fine. You win.”
-
-Live for the hope of it all, not because certainty awaits, but because you stayed until the odds had no choice but to choose you. Do what you love. Pursue what excites you even when odds stand against you. Keep doing the work even when the only certainty is the chance itself. The more you try, the more hope must find you. So keep showing up; stay in the race; live for the hope of it all, because the formula says it’s worth it.
-
-As my mindset evolved, so did my view of what I studied. Business Intelligence and Analytics was not merely a major; it became a language. Data turned into my lens for seeing the world. From Python scripts to Power BI dashboards, I grew excited not just by answers but by stories hidden in rows and columns. Each column is a decision; each row, a consequence. My mission is to uncover the “why” behind the “what.” Storytelling through data isn’t about flash; it’s about clarity and humanity.
-
-This realization crystallized during my internship at McKupler Inc. I arrived convinced I must dazzle with models and dashboards, yet my impact came from small acts: cleaning messy headers, mapping hubs, writing a reconciliation script, and standardizing product names. They weren’t dramatic, yet they made others’ work easier. I found purpose not in impressing, but in being useful, helping the team move forward. Data work isn’t always glamorous. Often it’s quiet, simply easing someone’s job, and that, to me, is more than enough.
-
-Looking ahead, I view my career not as a mere pursuit of analytics but as a lifelong practice in storytelling that turns raw numbers into living context. I want products that remember why something was saved, who it served, and which emotion accompanied it.
-
-One idea I nurture is Keep, an app storing shared links like messages to a friend while remembering intention. Another is my fascination with Pokémon analytics, using reinforcement learning to simulate battles for insight beyond victory. I aim to master AI automation, crafting workflows that let businesses scale without losing human context, echoing the automation I built for McKupler. That project showed how data paired with AI reshapes work, granting clarity and freeing people for what matters.
-
-My future aligns with ikigai; the intersection of what I love, what I’m good at, what the world needs, and what earns a living. Passion joins what I love and what I excel at: data storytelling, competitive Pokémon strategy, intuitive systems. Vocation joins what the world needs and what pays: businesses crave clear data, governments seek efficient systems, communities deserve meaningful tech. Mission joins what I love and what the world needs: tools like Keep that simplify life rather than overwhelm it. Profession joins skills and income: Python, Power BI, AI workflow design meeting market demand.
-
-At the center sits ikigai, my compass for every decision. And I remind myself: I am blessed to even be here. Blessed and privileged to find discomfort in the very path I chose, because it means I am swimming in the ocean I once longed to reach. How fortunate I am to struggle in the waves I once prayed to stand in. How fortunate I am to be exhausted from chasing the very thing I once only dreamed of touching.
-
-With that perspective, I set five promises. Number one, anything above zero compounds; small actions matter. Number two, I will show up for the 0.0001 percent; consistency bends odds. Number three, I will curate my tools, keeping only what I can master and use. Number four, story first, numbers second; meaning outweighs metrics. Lastly, I will leave things better, whether dataset, process, or person.
-
-If I packed college into a capsule, it wouldn’t hold every lecture or assignment. I’d keep the formula of hope, the passion for storytelling, the joy-filled projects, the skills I intend to master, and lessons for a lifetime. I may not know exactly where I’ll be in five years, yet I will still be trying, still showing up, still living for the hope of it all.
-
-To Benilde, I have a question. It might seem strange to ask just before graduating, but how do I really be like no other? Until now, I have no clue. Is it about being our own person, as we are all made of different numbers of atoms, different numbers of brain cells, and different numbers of seconds lived in this life? Is it about being so radically different even if I’d want to find inspiration in the numbers of someone else? But maybe it’s not about being like no other but being who I want to be, even if it’s like another. Maybe it’s not about being like no other, but embracing our life’s data will never be like Taylor Swift, will never be like Barack Obama, or will never be like Victor Wembanyama. But that’s okay; I can have my own numbers in the encounters I’ve had in life, yet find a pattern to trace similarities in the lives that I want to follow. To draw similarities in the lives that inspired me. In that way, I can be myself; in that way, I can be limitless; in that way, I can stay, and in that way, I can continue loving numbers. I’ve had a million experiences in Benilde. Each and every one of those, I treasure deeply in my heart. I have lived a life loving numbers, but honestly, *I’ve never loved them quite like this*.
-"""
-    st.markdown(
-        "<div style='font-size:1.05rem; line-height:1.85'>"
-        + reflections_md.replace("\n\n", "<br><br>")
-        + "</div>",
-        unsafe_allow_html=True,
-    )
+    if REFLECTIONS_PATH.name in ASSET_NAMES:
+        st.markdown(_reflections_html(*_file_key(REFLECTIONS_PATH)), unsafe_allow_html=True)
+    else:
+        st.info("Add `assets/reflections.html` to populate this page.")
     if SIGNATURE_PATH.exists():
         spacer, sigcol = st.columns([5, 2])
         with sigcol:
@@ -264,7 +307,7 @@ tab1, tab2, tab3, tab4 = st.tabs([
 ])
 
 with tab1:
-    render_showcase()
+    render_showcase(wide)
 with tab2:
     render_resume()
 with tab3: